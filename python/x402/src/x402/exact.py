@@ -1,10 +1,17 @@
 import time
 import secrets
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Callable, Dict, Any, List
 from typing_extensions import (
     TypedDict,
 )  # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
 from eth_account import Account
+from eth_hash.auto import keccak
+from eth_keys import keys
+from eth_keys.constants import SECPK1_N
+from eth_keys.exceptions import BadSignature, ValidationError
+from hexbytes import HexBytes
+from pydantic import BaseModel
 from x402.encoding import safe_base64_encode, safe_base64_decode
 from x402.types import (
     PaymentRequirements,
@@ -13,6 +20,127 @@ from x402.chains import get_chain_id
 import json
 
 
+# EIP-712 type hash for EIP-3009 `transferWithAuthorization`, shared by every signature
+_TRANSFER_WITH_AUTHORIZATION_TYPEHASH = keccak(
+    b"TransferWithAuthorization(address from,address to,uint256 value,"
+    b"uint256 validAfter,uint256 validBefore,bytes32 nonce)"
+)
+_EIP712_DOMAIN_TYPEHASH = keccak(
+    b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+_EIP712_VERSION_BYTES = b"\x19\x01"  # EIP-191 prefix and version byte for EIP-712 data
+_ADDRESS_PADDING = bytes(12)
+# EIP-2 upper bound on `s`; USDC's EIP-3009 ECRecover rejects signatures above it
+_SECPK1_HALF_N = SECPK1_N // 2
+
+
+@lru_cache(maxsize=32)
+def _chain_id(network: str) -> int:
+    """Resolve a network to its integer chain ID, cached per network."""
+    return int(get_chain_id(network))
+
+
+def _address_word(address: str) -> bytes:
+    """ABI-encode an address as a left-padded 32-byte word."""
+    if not isinstance(address, str):
+        raise TypeError(f"Address must be a hex string, got {type(address).__name__}")
+    raw = bytes.fromhex(address.removeprefix("0x"))
+    if len(raw) != 20:
+        raise ValueError(f"Invalid address: {address}")
+    return _ADDRESS_PADDING + raw
+
+
+@lru_cache(maxsize=256)
+def _digest_prefix(
+    name: str, version: str, chain_id: int, verifying_contract: str
+) -> bytes:
+    """Build the EIP-712 digest prefix (0x1901 + domain separator) for a token contract, cached per domain."""
+    domain_separator = keccak(
+        b"".join(
+            (
+                _EIP712_DOMAIN_TYPEHASH,
+                keccak(name.encode("utf-8")),
+                keccak(version.encode("utf-8")),
+                chain_id.to_bytes(32, "big"),
+                _address_word(verifying_contract),
+            )
+        )
+    )
+    return _EIP712_VERSION_BYTES + domain_separator
+
+
+def _bytes32_word(value: bytes) -> bytes:
+    """ABI-encode a bytes32 value, right-padding short values like eth_abi does."""
+    if len(value) > 32:
+        raise ValueError(f"Value exceeds 32 bytes: {value.hex()}")
+    return value.ljust(32, b"\x00")
+
+
+def _requirements_digest_prefix(payment_requirements: PaymentRequirements) -> bytes:
+    """Resolve the EIP-712 digest prefix for the token named in the payment requirements."""
+    return _digest_prefix(
+        payment_requirements.extra["name"],
+        payment_requirements.extra["version"],
+        _chain_id(payment_requirements.network),
+        payment_requirements.asset,
+    )
+
+
+def _strict_uint(value: Any) -> int:
+    """Parse an integer or a string of ASCII decimal digits, rejecting anything int() would coerce."""
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise TypeError(f"Expected an integer, got {type(value).__name__}")
+    if isinstance(value, str) and not (value.isascii() and value.isdigit()):
+        raise ValueError(f"Expected a decimal integer string, got {value!r}")
+    return int(value)
+
+
+def _authorization_digest(
+    digest_prefix: bytes, auth: Dict[str, Any], nonce: bytes, strict: bool = False
+) -> bytes:
+    """Compute the EIP-712 digest signed for an EIP-3009 authorization.
+
+    With `strict`, numeric fields must be integers or decimal digit strings, so a value
+    such as `10000.7` can't verify against the `10000` that was signed.
+    """
+    to_int = _strict_uint if strict else int
+    struct_hash = keccak(
+        b"".join(
+            (
+                _TRANSFER_WITH_AUTHORIZATION_TYPEHASH,
+                _address_word(auth["from"]),
+                _address_word(auth["to"]),
+                to_int(auth["value"]).to_bytes(32, "big"),
+                to_int(auth["validAfter"]).to_bytes(32, "big"),
+                to_int(auth["validBefore"]).to_bytes(32, "big"),
+                _bytes32_word(nonce),
+            )
+        )
+    )
+
+    return keccak(digest_prefix + struct_hash)
+
+
+def _verify_digest(digest: bytes, signature: bytes, signer: int) -> bool:
+    """Check that a 65-byte r||s||v signature over `digest` was produced by `signer`.
+
+    `signer` is the expected address as an integer; callers convert hex inputs once.
+    Like USDC's EIP-3009 ECRecover, signatures that are not exactly 65 bytes, use a high
+    `s` value, or have a `v` other than 27 or 28 are rejected.
+    """
+    if len(signature) != 65:
+        return False
+    if int.from_bytes(signature[32:64], "big") > _SECPK1_HALF_N:
+        return False
+    v = signature[64]
+    if v not in (27, 28):
+        return False
+    public_key = keys.Signature(
+        signature_bytes=signature[:64] + bytes((v - 27,))
+    ).recover_public_key_from_msg_hash(digest)
+    return int.from_bytes(public_key.to_canonical_address(), "big") == signer
+
+
 def create_nonce() -> bytes:
     """Create a random 32-byte nonce for authorization signatures."""
     return secrets.token_bytes(32)
@@ -23,8 +151,9 @@ def prepare_payment_header(
 ) -> Dict[str, Any]:
     """Prepare an unsigned payment header with sender address, x402 version, and payment requirements."""
     nonce = create_nonce()
-    valid_after = str(int(time.time()) - 60)  # 60 seconds before
-    valid_before = str(int(time.time()) + payment_requirements.max_timeout_seconds)
+    now = int(time.time())
+    valid_after = str(now - 60)  # 60 seconds before
+    valid_before = str(now + payment_requirements.max_timeout_seconds)
 
     return {
         "x402Version": x402_version,
@@ -51,78 +180,126 @@ class PaymentHeader(TypedDict):
     payload: dict[str, Any]
 
 
+def _sign_header(
+    sign_hash: Callable[[bytes], bytes],
+    payment_requirements: PaymentRequirements,
+    header: PaymentHeader,
+) -> str:
+    """Sign a payment header with `sign_hash`, which returns a 65-byte r||s||v signature."""
+    payload = header["payload"]
+    auth = payload["authorization"]
+
+    # Headers from `prepare_payment_header` carry the raw nonce bytes; use them as-is
+    nonce = auth["nonce"]
+    nonce_bytes = nonce if isinstance(nonce, bytes) else bytes.fromhex(nonce)
+
+    digest = _authorization_digest(
+        _requirements_digest_prefix(payment_requirements), auth, nonce_bytes
+    )
+    signature = sign_hash(digest)
+
+    # Fill in the header in place and encode it as-is; nothing is re-derived
+    payload["signature"] = "0x" + signature.hex()
+    auth["nonce"] = f"0x{nonce_bytes.hex()}"
+
+    return encode_payment(header)
+
+
 def sign_payment_header(
     account: Account, payment_requirements: PaymentRequirements, header: PaymentHeader
 ) -> str:
     """Sign a payment header using the account's private key."""
     try:
-        auth = header["payload"]["authorization"]
-
-        nonce_bytes = bytes.fromhex(auth["nonce"])
-
-        typed_data = {
-            "types": {
-                "TransferWithAuthorization": [
-                    {"name": "from", "type": "address"},
-                    {"name": "to", "type": "address"},
-                    {"name": "value", "type": "uint256"},
-                    {"name": "validAfter", "type": "uint256"},
-                    {"name": "validBefore", "type": "uint256"},
-                    {"name": "nonce", "type": "bytes32"},
-                ]
-            },
-            "primaryType": "TransferWithAuthorization",
-            "domain": {
-                "name": payment_requirements.extra["name"],
-                "version": payment_requirements.extra["version"],
-                "chainId": int(get_chain_id(payment_requirements.network)),
-                "verifyingContract": payment_requirements.asset,
-            },
-            "message": {
-                "from": auth["from"],
-                "to": auth["to"],
-                "value": int(auth["value"]),
-                "validAfter": int(auth["validAfter"]),
-                "validBefore": int(auth["validBefore"]),
-                "nonce": nonce_bytes,
-            },
-        }
-
-        signed_message = account.sign_typed_data(
-            domain_data=typed_data["domain"],
-            message_types=typed_data["types"],
-            message_data=typed_data["message"],
+        return _sign_header(
+            lambda digest: account.unsafe_sign_hash(digest).signature,
+            payment_requirements,
+            header,
         )
-        signature = signed_message.signature.hex()
-        if not signature.startswith("0x"):
-            signature = f"0x{signature}"
+    except Exception:
+        raise
 
-        header["payload"]["signature"] = signature
 
-        header["payload"]["authorization"]["nonce"] = f"0x{auth['nonce']}"
+def sign_payment_headers(
+    account: Account,
+    payment_requirements: PaymentRequirements,
+    headers: List[PaymentHeader],
+) -> List[str]:
+    """Sign many payment headers for the same payment requirements.
 
-        encoded = encode_payment(header)
-        return encoded
-    except Exception:
-        raise
+    The account's private key is parsed once for the whole batch rather than on every
+    signature, which skips re-deriving the public key per header.
+    """
+    private_key = keys.PrivateKey(account.key)
 
+    def sign_hash(digest: bytes) -> bytes:
+        # eth_keys returns r||s||v with v in {0, 1}; Ethereum signatures use 27/28
+        signature = private_key.sign_msg_hash(digest).to_bytes()
+        return signature[:64] + bytes((signature[64] + 27,))
 
-def encode_payment(payment_payload: Dict[str, Any]) -> str:
-    """Encode a payment payload into a base64 string, handling HexBytes and other non-serializable types."""
-    from hexbytes import HexBytes
-
-    def default(obj):
-        if isinstance(obj, HexBytes):
-            return obj.hex()
-        if hasattr(obj, "to_dict"):
-            return obj.to_dict()
-        if hasattr(obj, "hex"):
-            return obj.hex()
-        raise TypeError(
-            f"Object of type {obj.__class__.__name__} is not JSON serializable"
-        )
+    return [_sign_header(sign_hash, payment_requirements, h) for h in headers]
+
+
+def verify_payment_header(
+    payment_requirements: PaymentRequirements, header: PaymentHeader
+) -> bool:
+    """Verify that a signed payment header was signed by its authorization's `from` address."""
+    return verify_payment_headers(payment_requirements, [header])[0]
+
+
+def verify_payment_headers(
+    payment_requirements: PaymentRequirements, headers: List[PaymentHeader]
+) -> List[bool]:
+    """Verify the signatures of many signed payment headers against the same payment requirements.
+
+    Headers are expected in their decoded form (see `decode_payment`). The EIP-712 domain
+    separator is resolved once for the whole batch, so only the message hash and signer
+    recovery are computed per header. Invalid payment requirements raise; a malformed or
+    mis-signed header only marks that header as False.
+    """
+    digest_prefix = _requirements_digest_prefix(payment_requirements)
+
+    results = []
+    for header in headers:
+        try:
+            auth = header["payload"]["authorization"]
+            digest = _authorization_digest(
+                digest_prefix, auth, HexBytes(auth["nonce"]), strict=True
+            )
+            results.append(
+                _verify_digest(
+                    digest,
+                    bytes(HexBytes(header["payload"]["signature"])),
+                    int(auth["from"], 16),
+                )
+            )
+        except (
+            KeyError,
+            ValueError,
+            TypeError,
+            OverflowError,
+            BadSignature,
+            ValidationError,
+        ):
+            results.append(False)
+    return results
 
-    return safe_base64_encode(json.dumps(payment_payload, default=default))
+
+def _json_default(obj):
+    """Serialize bytes (including HexBytes) and pydantic models found in payment payloads."""
+    if isinstance(obj, bytes):
+        return obj.hex()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+# Built once: `json.dumps` with a `default=` constructs a new encoder on every call
+_payment_encoder = json.JSONEncoder(default=_json_default, separators=(",", ":"))
+
+
+def encode_payment(payment_payload: Dict[str, Any]) -> str:
+    """Encode a payment payload into a base64 string, handling bytes, HexBytes and pydantic models."""
+    return safe_base64_encode(_payment_encoder.encode(payment_payload))
 
 
 def decode_payment(encoded_payment: str) -> Dict[str, Any]:
@@ -88,6 +88,21 @@ def require_payment(
 
     facilitator = FacilitatorClient(facilitator_config)
 
+    # Validated once here; each request only fills in its own resource and output schema
+    # via model_copy, which does not re-run validation
+    payment_requirements_template = PaymentRequirements(
+        scheme="exact",
+        network=cast(SupportedNetworks, network),
+        asset=asset_address,
+        max_amount_required=max_amount_required,
+        resource=resource or "",
+        description=description,
+        mime_type=mime_type,
+        pay_to=pay_to_address,
+        max_timeout_seconds=max_deadline_seconds,
+        extra=eip712_domain,
+    )
+
     async def middleware(request: Request, call_next: Callable):
         # Skip if the path is not the same as the path in the middleware
         if not path_is_match(path, request.url.path):
@@ -98,29 +113,22 @@ def require_payment(
 
         # Construct payment details
         payment_requirements = [
-            PaymentRequirements(
-                scheme="exact",
-                network=cast(SupportedNetworks, network),
-                asset=asset_address,
-                max_amount_required=max_amount_required,
-                resource=resource_url,
-                description=description,
-                mime_type=mime_type,
-                pay_to=pay_to_address,
-                max_timeout_seconds=max_deadline_seconds,
-                # TODO: Rename output_schema to request_structure
-                output_schema={
-                    "input": {
-                        "type": "http",
-                        "method": request.method.upper(),
-                        "discoverable": discoverable
-                        if discoverable is not None
-                        else True,
-                        **(input_schema.model_dump() if input_schema else {}),
+            payment_requirements_template.model_copy(
+                update={
+                    "resource": resource_url,
+                    # TODO: Rename output_schema to request_structure
+                    "output_schema": {
+                        "input": {
+                            "type": "http",
+                            "method": request.method.upper(),
+                            "discoverable": discoverable
+                            if discoverable is not None
+                            else True,
+                            **(input_schema.model_dump() if input_schema else {}),
+                        },
+                        "output": output_schema,
                     },
-                    "output": output_schema,
-                },
-                extra=eip712_domain,
+                }
             )
         ]
 
@@ -144,6 +144,21 @@ class PaymentMiddleware:
 
         facilitator = FacilitatorClient(config["facilitator_config"])
 
+        # Validated once here; each request only fills in its own resource and output
+        # schema via model_copy, which does not re-run validation
+        payment_requirements_template = PaymentRequirements(
+            scheme="exact",
+            network=cast(SupportedNetworks, config["network"]),
+            asset=asset_address,
+            max_amount_required=max_amount_required,
+            resource=config["resource"] or "",
+            description=config["description"],
+            mime_type=config["mime_type"],
+            pay_to=config["pay_to_address"],
+            max_timeout_seconds=config["max_deadline_seconds"],
+            extra=eip712_domain,
+        )
+
         def middleware(environ, start_response):
             # Create Flask request context
             with self.app.request_context(environ):
@@ -162,31 +177,24 @@ class PaymentMiddleware:
 
                 # Construct payment details
                 payment_requirements = [
-                    PaymentRequirements(
-                        scheme="exact",
-                        network=cast(SupportedNetworks, config["network"]),
-                        asset=asset_address,
-                        max_amount_required=max_amount_required,
-                        resource=resource_url,
-                        description=config["description"],
-                        mime_type=config["mime_type"],
-                        pay_to=config["pay_to_address"],
-                        max_timeout_seconds=config["max_deadline_seconds"],
-                        # TODO: Rename output_schema to request_structure
-                        output_schema={
-                            "input": {
-                                "type": "http",
-                                "method": request.method.upper(),
-                                "discoverable": config.get("discoverable", True),
-                                **(
-                                    config["input_schema"].model_dump()
-                                    if config["input_schema"]
-                                    else {}
-                                ),
+                    payment_requirements_template.model_copy(
+                        update={
+                            "resource": resource_url,
+                            # TODO: Rename output_schema to request_structure
+                            "output_schema": {
+                                "input": {
+                                    "type": "http",
+                                    "method": request.method.upper(),
+                                    "discoverable": config.get("discoverable", True),
+                                    **(
+                                        config["input_schema"].model_dump()
+                                        if config["input_schema"]
+                                        else {}
+                                    ),
+                                },
+                                "output": config["output_schema"],
                             },
-                            "output": config["output_schema"],
-                        },
-                        extra=eip712_domain,
+                        }
                     )
                 ]
 
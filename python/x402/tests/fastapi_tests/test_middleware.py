@@ -374,6 +374,12 @@ def test_api_client_request_returns_json():
     assert "accepts" in response.json()
     assert "error" in response.json()
 
+    # Per-request fields are filled in on top of the validated requirements
+    accepts = response.json()["accepts"][0]
+    assert accepts["resource"] == "http://testserver/protected"
+    assert accepts["outputSchema"]["input"]["method"] == "GET"
+    assert accepts["payTo"] == "0x1111111111111111111111111111111111111111"
+
 
 def test_paywall_config_injection():
     """Test that paywall configuration is properly injected into HTML."""
@@ -209,6 +209,12 @@ def test_api_client_request_returns_json():
         assert "accepts" in resp.json
         assert "error" in resp.json
 
+        # Per-request fields are filled in on top of the validated requirements
+        accepts = resp.json["accepts"][0]
+        assert accepts["resource"] == "http://localhost/protected"
+        assert accepts["outputSchema"]["input"]["method"] == "GET"
+        assert accepts["payTo"] == "0x1"
+
 
 def test_paywall_config_injection():
     """Test that paywall configuration is properly injected into HTML."""
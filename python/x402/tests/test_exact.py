@@ -1,16 +1,21 @@
+import copy
 import pytest
 import time
 import base64
 from eth_account import Account
+from eth_keys.constants import SECPK1_N
 from hexbytes import HexBytes
 from x402.exact import (
     create_nonce,
     prepare_payment_header,
     sign_payment_header,
+    sign_payment_headers,
     encode_payment,
     decode_payment,
+    verify_payment_header,
+    verify_payment_headers,
 )
-from x402.types import PaymentRequirements
+from x402.types import EIP3009Authorization, PaymentRequirements
 
 
 @pytest.fixture
@@ -104,6 +109,75 @@ def test_sign_payment_header(account, payment_requirements):
     assert int(auth["validBefore"]) > int(time.time())
 
 
+def test_sign_payment_header_bytes_nonce(account, payment_requirements):
+    unsigned_header = prepare_payment_header(account.address, 1, payment_requirements)
+    nonce = unsigned_header["payload"]["authorization"]["nonce"]
+
+    # Nonce is signed directly from the bytes produced by prepare_payment_header
+    signed_message = sign_payment_header(account, payment_requirements, unsigned_header)
+
+    decoded = decode_payment(signed_message)
+    assert decoded["payload"]["authorization"]["nonce"] == f"0x{nonce.hex()}"
+    assert verify_payment_header(payment_requirements, decoded)
+
+
+def test_sign_payment_header_matches_typed_data(account, payment_requirements):
+    unsigned_header = prepare_payment_header(account.address, 1, payment_requirements)
+    auth = unsigned_header["payload"]["authorization"]
+    nonce = auth["nonce"]
+    auth["nonce"] = nonce.hex()
+
+    expected = account.sign_typed_data(
+        domain_data={
+            "name": payment_requirements.extra["name"],
+            "version": payment_requirements.extra["version"],
+            "chainId": 84532,
+            "verifyingContract": payment_requirements.asset,
+        },
+        message_types={
+            "TransferWithAuthorization": [
+                {"name": "from", "type": "address"},
+                {"name": "to", "type": "address"},
+                {"name": "value", "type": "uint256"},
+                {"name": "validAfter", "type": "uint256"},
+                {"name": "validBefore", "type": "uint256"},
+                {"name": "nonce", "type": "bytes32"},
+            ]
+        },
+        message_data={
+            "from": auth["from"],
+            "to": auth["to"],
+            "value": int(auth["value"]),
+            "validAfter": int(auth["validAfter"]),
+            "validBefore": int(auth["validBefore"]),
+            "nonce": nonce,
+        },
+    )
+
+    signed_message = sign_payment_header(account, payment_requirements, unsigned_header)
+
+    decoded = decode_payment(signed_message)
+    assert decoded["payload"]["signature"] == expected.signature.to_0x_hex()
+
+
+def test_sign_payment_headers(account, payment_requirements):
+    headers = [
+        prepare_payment_header(account.address, 1, payment_requirements)
+        for _ in range(3)
+    ]
+    expected = [
+        sign_payment_header(account, payment_requirements, copy.deepcopy(h))
+        for h in headers
+    ]
+
+    signed = sign_payment_headers(account, payment_requirements, headers)
+
+    # Batch signing produces the same (deterministic) signatures as one-by-one signing
+    assert signed == expected
+    for encoded in signed:
+        assert verify_payment_header(payment_requirements, decode_payment(encoded))
+
+
 def test_sign_payment_header_no_account(payment_requirements):
     unsigned_header = prepare_payment_header(
         "0x0000000000000000000000000000000000000000", 1, payment_requirements
@@ -117,6 +191,117 @@ def test_sign_payment_header_no_account(payment_requirements):
         sign_payment_header(None, payment_requirements, unsigned_header)
 
 
+def _signed_header(account, payment_requirements):
+    unsigned_header = prepare_payment_header(account.address, 1, payment_requirements)
+    nonce = unsigned_header["payload"]["authorization"]["nonce"]
+    unsigned_header["payload"]["authorization"]["nonce"] = nonce.hex()
+    return decode_payment(
+        sign_payment_header(account, payment_requirements, unsigned_header)
+    )
+
+
+def test_verify_payment_header(account, payment_requirements):
+    header = _signed_header(account, payment_requirements)
+    assert verify_payment_header(payment_requirements, header)
+
+    # Tampered value no longer matches the signature
+    header["payload"]["authorization"]["value"] = "20000"
+    assert not verify_payment_header(payment_requirements, header)
+
+
+def test_verify_payment_headers(payment_requirements):
+    accounts = [Account.create() for _ in range(5)]
+    headers = [_signed_header(a, payment_requirements) for a in accounts]
+
+    # Claim a payer that did not sign the authorization
+    headers[1]["payload"]["authorization"]["from"] = accounts[0].address
+    # Malformed signature
+    headers[2]["payload"]["signature"] = "0x1234"
+    # Non-string addresses only fail their own header, not the whole batch
+    headers[3]["payload"]["authorization"]["from"] = None
+    headers[4]["payload"]["authorization"]["to"] = 123
+
+    assert verify_payment_headers(payment_requirements, headers) == [
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_verify_payment_headers_rejects_coerced_amounts(account, payment_requirements):
+    headers = [_signed_header(account, payment_requirements) for _ in range(5)]
+    auths = [h["payload"]["authorization"] for h in headers]
+
+    # Each value is what int() would coerce back to the signed amount
+    auths[0]["value"] = float(auths[0]["value"]) + 0.7
+    auths[1]["value"] = f" {auths[1]['value']} "
+    auths[2]["value"] = f"{auths[2]['value'][0]}_{auths[2]['value'][1:]}"
+    auths[3]["validAfter"] = float(auths[3]["validAfter"])
+    auths[4]["validBefore"] = float(auths[4]["validBefore"])
+
+    assert verify_payment_headers(payment_requirements, headers) == [False] * 5
+
+    # A boolean is not an amount, even if the signed value was 1
+    one_unit = payment_requirements.model_copy(update={"max_amount_required": "1"})
+    header = _signed_header(account, one_unit)
+    header["payload"]["authorization"]["value"] = True
+    assert not verify_payment_header(one_unit, header)
+
+    # Plain JSON integers are still accepted
+    header = _signed_header(account, payment_requirements)
+    header["payload"]["authorization"]["value"] = 10000
+    assert verify_payment_header(payment_requirements, header)
+
+
+def test_verify_payment_headers_invalid_requirements(account, payment_requirements):
+    headers = [_signed_header(account, payment_requirements)]
+
+    # Problems with the requirements raise instead of failing every header
+    unsupported_network = payment_requirements.model_copy(update={"network": "nope"})
+    with pytest.raises(ValueError):
+        verify_payment_headers(unsupported_network, headers)
+
+    missing_domain = payment_requirements.model_copy(update={"extra": {}})
+    with pytest.raises(KeyError):
+        verify_payment_headers(missing_domain, headers)
+
+
+def test_verify_payment_header_rejects_trailing_signature_bytes(
+    account, payment_requirements
+):
+    header = _signed_header(account, payment_requirements)
+    header["payload"]["signature"] += "ffff"
+
+    assert not verify_payment_header(payment_requirements, header)
+
+
+def test_verify_payment_header_rejects_high_s(account, payment_requirements):
+    header = _signed_header(account, payment_requirements)
+    signature = HexBytes(header["payload"]["signature"])
+
+    # (r, n - s) with the other recovery id recovers the same signer but is
+    # the malleable high-s form (EIP-2)
+    high_s = SECPK1_N - int.from_bytes(signature[32:64], "big")
+    flipped_v = 28 if signature[64] == 27 else 27
+    flipped = signature[:32] + high_s.to_bytes(32, "big") + bytes((flipped_v,))
+    header["payload"]["signature"] = HexBytes(flipped).to_0x_hex()
+
+    assert not verify_payment_header(payment_requirements, header)
+
+
+def test_verify_payment_header_rejects_raw_recovery_id(account, payment_requirements):
+    header = _signed_header(account, payment_requirements)
+    signature = HexBytes(header["payload"]["signature"])
+
+    # v as a raw 0/1 recovery id recovers the same signer, but ECRecover requires 27/28
+    raw_v = signature[:64] + bytes((signature[64] - 27,))
+    header["payload"]["signature"] = HexBytes(raw_v).to_0x_hex()
+
+    assert not verify_payment_header(payment_requirements, header)
+
+
 def test_encode_payment():
     # Test basic encoding
     data = {"test": "value"}
@@ -133,25 +318,42 @@ def test_encode_payment():
     decoded = decode_payment(encoded)
     assert decoded["test"] == "1234"  # Implementation returns hex without 0x prefix
 
-    # Test object with to_dict
-    class TestObject:
-        def to_dict(self):
-            return {"test": "value"}
-
-    data = {"test": TestObject()}
+    # Test plain bytes handling
+    data = {"test": b"\x12\x34"}
+    encoded = encode_payment(data)
+    decoded = decode_payment(encoded)
+    assert decoded["test"] == "1234"
+
+    # Test pydantic models are dumped with their aliases
+    authorization = EIP3009Authorization(
+        **{
+            "from": "0x1111111111111111111111111111111111111111",
+            "to": "0x2222222222222222222222222222222222222222",
+            "value": "10000",
+            "valid_after": "0",
+            "valid_before": "1",
+            "nonce": "0x1234",
+        }
+    )
+    data = {"test": authorization}
     encoded = encode_payment(data)
     decoded = decode_payment(encoded)
-    assert decoded["test"] == {"test": "value"}
+    assert decoded["test"] == {
+        "from": "0x1111111111111111111111111111111111111111",
+        "to": "0x2222222222222222222222222222222222222222",
+        "value": "10000",
+        "validAfter": "0",
+        "validBefore": "1",
+        "nonce": "0x1234",
+    }
 
-    # Test object with hex
+    # Objects that merely expose to_dict/hex are not serialized implicitly
     class HexObject:
         def hex(self):
             return "0x1234"
 
-    data = {"test": HexObject()}
-    encoded = encode_payment(data)
-    decoded = decode_payment(encoded)
-    assert decoded["test"] == "0x1234"
+    with pytest.raises(TypeError):
+        encode_payment({"test": HexObject()})
 
     # Test non-serializable object
     class NonSerializable: